@@ -1,6 +1,7 @@
+import collections.abc
 import dataclasses
 import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
 
 @dataclasses.dataclass
@@ -72,3 +73,165 @@ class Resume:
 	certifications: List[Certification]
 	education: List[Education]
 	courses: List[Education]
+
+
+class FrozenMapping(collections.abc.Mapping):
+	__slots__ = ("_data", "_hash")
+
+	def __init__(self, data: Mapping = None):
+		self._data = dict(data) if data is not None else {}
+		# Mapping equality ignores order, so the hash must as well. Hashing up front also rejects mutable values here
+		self._hash = hash(frozenset(self._data.items()))
+
+	def __getitem__(self, key):
+		return self._data[key]
+
+	def __iter__(self):
+		return iter(self._data)
+
+	def __len__(self) -> int:
+		return len(self._data)
+
+	def __hash__(self) -> int:
+		return self._hash
+
+	def __reduce__(self):
+		return type(self), (self._data,)
+
+	def __repr__(self) -> str:
+		return f"{type(self).__name__}({self._data!r})"
+
+
+def _from_mutable(cls, obj):
+	return cls(**{field.name: getattr(obj, field.name) for field in dataclasses.fields(cls) if field.init})
+
+
+def _freeze(value, mutable_cls, convert):
+	return convert(value) if isinstance(value, mutable_cls) else value
+
+
+def _freeze_description(description: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+	return tuple(description) if description is not None else None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FrozenAuthor:
+	name: str
+	title: str
+	phone: str
+	email: str
+	address: str
+	linkedin: str = None
+	github: str = None
+
+	@classmethod
+	def from_author(cls, author: Author) -> "FrozenAuthor":
+		return _from_mutable(cls, author)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FrozenResumeContentBlock:
+	title: str
+	subtitle: Optional[str] = None
+	location: Optional[str] = None
+	start_day: Optional[datetime.date] = None
+	end_day: Optional[datetime.date] = None
+	description: Optional[Tuple[str, ...]] = None
+
+	def __post_init__(self):
+		object.__setattr__(self, "description", _freeze_description(self.description))
+
+	@classmethod
+	def from_block(cls, block: ResumeContentBlock) -> "FrozenResumeContentBlock":
+		return _from_mutable(cls, block)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FrozenWorkExperience:
+	company: str
+	job_title: str
+	location: Optional[str]
+	start_day: datetime.date
+	end_day: Optional[datetime.date]
+	description: Tuple[str, ...]
+	# Derived once on construction instead of on every access
+	content: FrozenResumeContentBlock = dataclasses.field(init=False, repr=False, compare=False)
+
+	def __post_init__(self):
+		object.__setattr__(self, "description", tuple(self.description))
+		object.__setattr__(self, "content", FrozenResumeContentBlock(
+			title=self.company, subtitle=self.job_title, location=self.location,
+			start_day=self.start_day, end_day=self.end_day, description=self.description,
+		))
+
+	@classmethod
+	def from_experience(cls, exp: WorkExperience) -> "FrozenWorkExperience":
+		return _from_mutable(cls, exp)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FrozenCertification:
+	name: str
+	day: datetime.date
+
+	@classmethod
+	def from_certification(cls, cert: Certification) -> "FrozenCertification":
+		return _from_mutable(cls, cert)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FrozenEducation:
+	school: Optional[str]
+	course: Optional[str]
+	location: str
+	gpa: Optional[float]
+	start_day: datetime.date
+	end_day: Optional[datetime.date]
+	description: Tuple[str, ...]
+	# Derived once on construction instead of on every access
+	content: FrozenResumeContentBlock = dataclasses.field(init=False, repr=False, compare=False)
+
+	def __post_init__(self):
+		object.__setattr__(self, "description", tuple(self.description))
+		course = self.course if self.gpa is None else f"{self.course}   [GPA: {self.gpa:.2f}]"
+		title = self.school if self.school is not None else course
+		subtitle = course if self.school is not None else None
+		object.__setattr__(self, "content", FrozenResumeContentBlock(
+			title=title, subtitle=subtitle, location=self.location,
+			start_day=self.start_day, end_day=self.end_day, description=self.description,
+		))
+
+	@classmethod
+	def from_education(cls, edu: Education) -> "FrozenEducation":
+		return _from_mutable(cls, edu)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FrozenResume:
+	author: FrozenAuthor
+	pitch: str
+	skills: FrozenMapping[str, Tuple[str, ...]]
+	experience: Tuple[FrozenWorkExperience, ...]
+	custom_sections: FrozenMapping[str, Tuple[FrozenResumeContentBlock, ...]]
+	certifications: Tuple[FrozenCertification, ...]
+	education: Tuple[FrozenEducation, ...]
+	courses: Tuple[FrozenEducation, ...]
+
+	def __post_init__(self):
+		# Mutable data classes passed in are converted, so the resume is frozen however it was built
+		object.__setattr__(self, "author", _freeze(self.author, Author, FrozenAuthor.from_author))
+		object.__setattr__(self, "skills", FrozenMapping({skill: tuple(skill_list) for skill, skill_list in self.skills.items()}))
+		object.__setattr__(self, "experience", tuple(_freeze(exp, WorkExperience, FrozenWorkExperience.from_experience) for exp in self.experience))
+		object.__setattr__(self, "custom_sections", FrozenMapping({
+			name: tuple(_freeze(block, ResumeContentBlock, FrozenResumeContentBlock.from_block) for block in blocks)
+			for name, blocks in self.custom_sections.items()
+		}))
+		object.__setattr__(self, "certifications", tuple(_freeze(cert, Certification, FrozenCertification.from_certification) for cert in self.certifications))
+		object.__setattr__(self, "education", tuple(_freeze(edu, Education, FrozenEducation.from_education) for edu in self.education))
+		object.__setattr__(self, "courses", tuple(_freeze(edu, Education, FrozenEducation.from_education) for edu in self.courses))
+		# Raise TypeError for anything else unhashable now, rather than the first time the resume is hashed
+		hash(self)
+
+	@classmethod
+	def from_resume(cls, resume: Resume) -> "FrozenResume":
+		return _from_mutable(cls, resume)
@@ -0,0 +1,22 @@
+import tracemalloc
+
+from data import FrozenResume
+from sample_resume import make_resume
+
+RESUME_COUNT = 20000
+
+
+def measure(build):
+	tracemalloc.start()
+	resumes = build()
+	size, _ = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return size / len(resumes)
+
+
+if __name__ == "__main__":
+	mutable = measure(lambda: [make_resume(idx) for idx in range(RESUME_COUNT)])
+	# Measure the frozen copies only, once the mutable source resume has been dropped
+	frozen = measure(lambda: [FrozenResume.from_resume(make_resume(idx)) for idx in range(RESUME_COUNT)])
+	print(f" mutable: {mutable:>8.0f} bytes/resume")
+	print(f"  frozen: {frozen:>8.0f} bytes/resume ({frozen / mutable:.0%} of mutable)")
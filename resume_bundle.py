@@ -0,0 +1,33 @@
+from typing import BinaryIO, Callable, Optional, Type, Union
+
+from data import Resume
+from resume_generator import PAGE_SIZE, ResumeGenerator
+
+from reportlab.pdfgen import canvas
+
+
+class ResumeBundleGenerator:
+	def __init__(self, output: Union[str, BinaryIO], generator_class: Type[ResumeGenerator] = ResumeGenerator):
+		self.generator_class = generator_class
+		self.page_size = PAGE_SIZE
+		self.canvas = canvas.Canvas(output, pagesize=self.page_size)
+		self.canvas.showOutline()
+		self.resume_count = 0
+
+	def add(self, resume: Resume, draw: Callable[[ResumeGenerator], None], title: Optional[str] = None) -> ResumeGenerator:
+		# Every resume starts on a fresh page, with its own outline entry pointing at that page
+		if self.resume_count > 0:
+			self.canvas.showPage()
+		bookmark = f"resume-{self.resume_count}"
+		self.canvas.bookmarkPage(bookmark)
+		self.canvas.addOutlineEntry(title if title is not None else resume.author.name, bookmark, level=0)
+		# The generator shares the bundle's canvas, so a save() inside draw is a no-op; call save() on the bundle instead
+		generator = self.generator_class(resume, None, pdf_canvas=self.canvas)
+		if generator.page_size != self.page_size:
+			raise ValueError(f"{self.generator_class.__name__} draws on {generator.page_size} pages, but the bundle uses {self.page_size}")
+		draw(generator)
+		self.resume_count += 1
+		return generator
+
+	def save(self):
+		self.canvas.save()
@@ -0,0 +1,56 @@
+import contextlib
+import io
+import time
+
+from resume_bundle import ResumeBundleGenerator
+from resume_generator import ResumeGenerator
+from sample_resume import make_resume
+
+RESUME_COUNT = 200
+
+
+def draw(gen: ResumeGenerator):
+	gen.draw_author()
+	gen.draw_pitch()
+	gen.draw_skills()
+	gen.draw_work_experience()
+	gen.draw_certifications()
+	gen.draw_custom_section("PROJECTS")
+	gen.draw_education()
+	gen.draw_courses()
+
+
+def benchmark_separate(resumes: list):
+	total_bytes = 0
+	start = time.perf_counter()
+	for resume in resumes:
+		output = io.BytesIO()
+		gen = ResumeGenerator(resume, output)
+		draw(gen)
+		gen.save()
+		total_bytes += len(output.getvalue())
+	return total_bytes, time.perf_counter() - start
+
+
+def benchmark_bundle(resumes: list):
+	output = io.BytesIO()
+	start = time.perf_counter()
+	bundle = ResumeBundleGenerator(output)
+	for resume in resumes:
+		bundle.add(resume, draw)
+	bundle.save()
+	return len(output.getvalue()), time.perf_counter() - start
+
+
+if __name__ == "__main__":
+	resumes = [make_resume(idx) for idx in range(RESUME_COUNT)]
+	results = {}
+	# The generators print every line they draw, so keep that out of the timings
+	with contextlib.redirect_stdout(io.StringIO()):
+		# Untimed warm-up so neither measurement pays for the one-time font parsing
+		benchmark_separate(resumes[:1])
+		for name, benchmark in [("separate", benchmark_separate), ("bundle", benchmark_bundle)]:
+			results[name] = benchmark(resumes)
+	for name, (total_bytes, elapsed) in results.items():
+		print(f"{name:>8}: {total_bytes:>10} bytes total, {total_bytes / len(resumes):>9.0f} bytes/resume, "
+		      f"{elapsed * 1000 / len(resumes):.2f} ms/resume")
@@ -10,18 +10,29 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 
 
+PAGE_SIZE = (8.5 * inch, 11 * inch)
+
+
+def register_fonts():
+	# Only register each font once, so every resume drawn on a shared canvas references the same embedded font
+	registered = set(pdfmetrics.getRegisteredFontNames())
+	for font_name, font_file in [("Calibri", "Calibri.ttf"), ("Calibri-Bold", "CalibriBold.ttf"), ("Symbola", "Symbola.ttf")]:
+		if font_name not in registered:
+			pdfmetrics.registerFont(TTFont(font_name, font_file))
+
+
 class ResumeGenerator:
-	def __init__(self, resume: Resume, output_path: str):
-		pdfmetrics.registerFont(TTFont("Calibri", "Calibri.ttf"))
-		pdfmetrics.registerFont(TTFont("Calibri-Bold", "CalibriBold.ttf"))
-		pdfmetrics.registerFont(TTFont("Symbola", "Symbola.ttf"))
-		self.page_size = (8.5 * inch, 11 * inch)
+	def __init__(self, resume: Resume, output_path: Optional[str], pdf_canvas: Optional[canvas.Canvas] = None):
+		register_fonts()
+		self.page_size = PAGE_SIZE
 		self.margin = (0.25 * inch, 0.25 * inch)
 		self.default_font = ("Calibri", 12)
 		self.pos = self.page_size[1] - self.margin[1]
 		self.font = None
 		self.resume = resume
-		self.canvas = canvas.Canvas(output_path, pagesize=self.page_size)
+		# A canvas passed in is shared with other resumes, so only its owner may save it
+		self.owns_canvas = pdf_canvas is None
+		self.canvas = pdf_canvas if pdf_canvas is not None else canvas.Canvas(output_path, pagesize=self.page_size)
 
 	def _set_font(self, height: float, bold: bool):
 		font_name = "Calibri-Bold" if bold else "Calibri"
@@ -109,7 +120,9 @@ class ResumeGenerator:
 		for col, val in enumerate(row):
 			self._set_font(height[col], bold[col])
 			for line in self._split_line(val)[0]:
-				self.canvas.drawString(self.margin[0] + sum(width[:col]), self.pos, line)
+				idx = self.margin[0] + sum(width[:col])
+				for token in line:
+					idx += self._draw_token(token, height[col], idx, bold[col], underline=False)
 				max_height = max(max_height, height[col] + 2)
 		self.pos -= max_height
 
@@ -282,4 +295,5 @@ class ResumeGenerator:
 		self.__draw_education_list("COURSES", courses)
 
 	def save(self):
-		self.canvas.save()
+		if self.owns_canvas:
+			self.canvas.save()
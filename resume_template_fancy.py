@@ -1,6 +1,6 @@
 import pathlib
 import re
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from data import Education, Resume, ResumeContentBlock
 from resume_generator import ResumeGenerator
@@ -32,8 +32,8 @@ class TemporaryMarginIncrease:
 
 
 class ResumeTemplateFancy(ResumeGenerator):
-	def __init__(self, resume: Resume, output_path: str):
-		super().__init__(resume, output_path)
+	def __init__(self, resume: Resume, output_path: Optional[str], pdf_canvas: Optional[canvas.Canvas] = None):
+		super().__init__(resume, output_path, pdf_canvas)
 		self.text_color = HexColor(0x000000)
 		self.left_bar_color = HexColor(0xFFBD88)
 		self.left_bar_text_color = HexColor(0x000000)
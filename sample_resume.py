@@ -0,0 +1,56 @@
+from datetime import date
+
+from data import Resume, ResumeContentBlock, Author, WorkExperience, Certification, Education
+
+
+def make_resume(idx: int) -> Resume:
+	return Resume(
+		author=Author(
+			name=f"Candidate {idx}",
+			title="Software Engineer",
+			phone="(123) 456-7890",
+			email=f"candidate{idx}@example.com",
+			address="1234 Elm Street, Some City, ST 12345"
+		),
+		pitch="Software engineer with experience designing, developing, and maintaining software applications.",
+		skills={
+			"Languages": ["Java", "Python", "JavaScript", "SQL"],
+			"Tools": ["Git", "Docker", "Kubernetes", "AWS"],
+		},
+		experience=[
+			WorkExperience(
+				company=f"Company {idx}",
+				job_title="Software Engineer",
+				location="Some City, TX",
+				start_day=date(2020, 1, 1),
+				end_day=None,
+				description=[
+					"Designed and developed scalable web applications, enhancing user experience and application performance.",
+					"Implemented CI/CD pipelines, significantly speeding up the deployment process and reducing errors.",
+				]
+			),
+		],
+		custom_sections={
+			"PROJECTS": [
+				ResumeContentBlock(
+					title="Project Management Tool",
+					description=["Developed a web-based project management tool enabling teams to track progress."]
+				),
+			],
+		},
+		certifications=[
+			Certification("Certified ScrumMaster (CSM)", date(2021, 4, 1)),
+		],
+		education=[
+			Education(
+				school="Western Institute of Technology",
+				course="Bachelor of Science in Computer Science",
+				location="Innovate City, CA",
+				gpa=3.70,
+				start_day=date(2012, 8, 1),
+				end_day=date(2016, 5, 1),
+				description=[]
+			),
+		],
+		courses=[],
+	)